@@ -1,11 +1,34 @@
 """Sphinx configuration for xarray-ome documentation."""
 
+import os
+from pathlib import Path
+
+DOCS_DIR = Path(__file__).parent
+BUILD_DIR = DOCS_DIR / "_build"
+
+
+def _has_notebooks(root: Path) -> bool:
+    """Return True if any source is an .ipynb or a MyST text notebook."""
+    for path in root.rglob("*"):
+        if BUILD_DIR in path.parents:
+            continue
+        if path.suffix == ".ipynb":
+            return True
+        if path.suffix == ".md":
+            text = path.read_text(encoding="utf-8")
+            if text.startswith("---") and "kernelspec:" in text:
+                return True
+    return False
+
+
+HAS_NOTEBOOKS = _has_notebooks(DOCS_DIR)
+
 project = "xarray-ome"
 copyright = "2025, xarray-ome contributors"
 author = "xarray-ome contributors"
 
 extensions = [
-    "myst_nb",
+    "myst_nb" if HAS_NOTEBOOKS else "myst_parser",
     "sphinx.ext.autodoc",
     "sphinx.ext.napoleon",
     "sphinx.ext.viewcode",
@@ -20,12 +43,24 @@ myst_enable_extensions = [
     "fieldlist",
 ]
 
-nb_execution_mode = "cache"
-nb_execution_timeout = 300
-nb_execution_raise_on_error = True
+if HAS_NOTEBOOKS:
+    nb_execution_mode = "cache"
+    nb_execution_timeout = 300
+    # The example notebooks read from IDR over the network. Outside strict builds a
+    # failing notebook is reported as a warning instead of aborting the whole build.
+    # Its failed output is kept in the persisted doctrees, and Sphinx does not re-read
+    # an unchanged page, so run `make clean` (or touch the page) to retry it.
+    # Read the Docs publishes the docs, so its builds are strict unless STRICT_NB=0:
+    # a failed build keeps the last good version online instead of tracebacks.
+    strict_default = "1" if os.environ.get("READTHEDOCS") == "True" else "0"
+    nb_execution_raise_on_error = os.environ.get("STRICT_NB", strict_default) == "1"
+    # Keep the notebook cache at a fixed location next to the doctrees so that it
+    # survives across builds regardless of the output directory passed to sphinx-build.
+    nb_execution_cache_path = str(BUILD_DIR / ".jupyter_cache")
 
 templates_path = ["_templates"]
 exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
+suppress_warnings = ["epub.unknown_project_files"]
 
 html_theme = "sphinx_book_theme"
 html_static_path = ["_static"]
@@ -36,6 +71,8 @@ html_theme_options = {
     "use_repository_button": True,
     "use_issues_button": True,
     "path_to_docs": "docs",
+    "collapse_navigation": True,
+    "navigation_depth": 2,
     "logo": {
         "image_light": "_static/xarray-ome-logo.png",
         "image_dark": "_static/xarray-ome-logo.png",
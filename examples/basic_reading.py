@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from xarray_ome import open_ome_dataset, open_ome_datatree
+from xarray_ome import open_ome_datatree
 
 
 def main() -> None:
@@ -26,18 +26,21 @@ def main() -> None:
     print(f"\nRoot attrs: {dt.attrs.keys()}")
 
     # Iterate through resolution levels
+    # DataTree nodes expose sizes/coords directly, without building a Dataset view
     for child_name, child_node in dt.children.items():
         print(f"\n{child_name}:")
-        print(f"  Shape: {child_node.ds.dims}")
-        print(f"  Coordinates: {list(child_node.ds.coords.keys())}")
+        print(f"  Shape: {dict(child_node.sizes)}")
+        print(f"  Coordinates: {list(child_node.coords)}")
 
     # Example 2: Read single resolution level as Dataset
     print("\n" + "=" * 50)
     print("Example 2: Reading single resolution as Dataset")
     print("-" * 50)
 
-    # Open highest resolution (level 0)
-    ds = open_ome_dataset(sample_path, resolution=0)
+    # The DataTree above already holds every level, so take level 0 from it
+    # rather than opening the store a second time. For a standalone read use:
+    #     ds = open_ome_dataset(sample_path, resolution=0)
+    ds = dt["scale0"].ds
     print(f"Dataset:\n{ds}")
     print("\nCoordinates:")
     for coord_name, coord in ds.coords.items():
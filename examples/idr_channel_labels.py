@@ -1,10 +1,19 @@
 """Example loading IDR data with channel labels."""
 
+import sys
+
+import numpy as np
+
 import xarray_ome as xo
 
 
-def main() -> None:
-    """Load IDR sample data and demonstrate channel label usage."""
+def main(verify: bool = False) -> None:
+    """Load IDR sample data and demonstrate channel label usage.
+
+    Coordinate ranges are derived from the OME scale/translation metadata.
+    Pass ``verify=True`` (``--verify`` on the command line) to also check
+    them against the coordinate values.
+    """
     # Load IDR sample with channel labels
     url = "https://uk1s3.embassy.ebi.ac.uk/idr/zarr/v0.4/idr0062A/6001240.zarr"
 
@@ -31,11 +40,15 @@ def main() -> None:
     print("Selecting by Channel Name")
     print("-" * 60)
 
+    image = ds["image"]
+    channel_shape = image.isel(c=0).shape
     for channel in ds.coords["c"].values:
-        channel_data = ds.sel(c=channel)
         print(f"\n{channel}:")
-        print(f"  Shape: {channel_data['image'].shape}")
-        print(f"  Data type: {channel_data['image'].dtype}")
+        print(f"  Shape: {channel_shape}")
+        print(f"  Data type: {image.dtype}")
+
+    first_channel = ds.coords["c"].values[0]
+    print(f"\nds.sel(c={first_channel!r}): {ds.sel(c=first_channel)['image'].shape}")
 
     print("\n" + "-" * 60)
     print("Physical Coordinates")
@@ -43,11 +56,17 @@ def main() -> None:
 
     # Show physical coordinates
     for coord_name in ["z", "y", "x"]:
-        coord = ds.coords[coord_name]
+        scale = ds.attrs["ome_scale"][coord_name]
+        start = ds.attrs["ome_translation"][coord_name]
+        stop = start + scale * (ds.sizes[coord_name] - 1)
         print(f"\n{coord_name}:")
         print(f"  Unit: {ds.attrs['ome_axes_units'][coord_name]}")
-        print(f"  Range: [{coord.min().values:.2f}, {coord.max().values:.2f}]")
-        print(f"  Spacing: {coord[1].values - coord[0].values:.4f}")
+        print(f"  Range: [{start:.2f}, {stop:.2f}]")
+        print(f"  Spacing: {scale:.4f}")
+
+        if verify:
+            values = ds.coords[coord_name].values
+            assert np.isclose(values.min(), start) and np.isclose(values.max(), stop)
 
     print("\n" + "-" * 60)
     print("Metadata Attributes")
@@ -61,4 +80,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    main(verify="--verify" in sys.argv[1:])
@@ -3,6 +3,8 @@
 import sys
 from pathlib import Path
 
+import numpy as np
+
 from xarray_ome import open_ome_datatree
 
 
@@ -36,10 +38,10 @@ def inspect_ome_zarr(path: Path) -> None:
     # Print resolution levels
     print("\nResolution Levels:")
     print("-" * 70)
+    # Read straight from each node; child_node.ds would build a new Dataset view
     for child_name, child_node in dt.children.items():
-        ds = child_node.ds
-        first_var = next(iter(ds.data_vars))
-        data_array = ds[first_var]
+        first_var = next(iter(child_node.data_vars))
+        data_array = child_node[first_var]
 
         print(f"\n{child_name}:")
         print(f"  Dimensions: {dict(data_array.sizes)}")
@@ -48,16 +50,21 @@ def inspect_ome_zarr(path: Path) -> None:
 
         # Print coordinate info
         print("  Coordinates:")
-        for coord_name, coord in ds.coords.items():
-            coord_min = float(coord.min())
-            coord_max = float(coord.max())
-            print(f"    {coord_name}: [{coord_min:.3f}, {coord_max:.3f}] ({len(coord)} points)")
+        for coord_name, coord in child_node.coords.items():
+            values = np.asarray(coord.values)
+            if values.dtype.kind in "iuf":
+                print(
+                    f"    {coord_name}: [{values.min():.3f}, {values.max():.3f}] "
+                    f"({values.size} points)"
+                )
+            else:
+                print(f"    {coord_name}: {values.tolist()}")
 
         # Print scale/translation if available
-        if "ome_scale" in ds.attrs:
-            print(f"  Scale: {ds.attrs['ome_scale']}")
-        if "ome_translation" in ds.attrs:
-            print(f"  Translation: {ds.attrs['ome_translation']}")
+        if "ome_scale" in child_node.attrs:
+            print(f"  Scale: {child_node.attrs['ome_scale']}")
+        if "ome_translation" in child_node.attrs:
+            print(f"  Translation: {child_node.attrs['ome_translation']}")
 
 
 def main() -> None:
@@ -13,11 +13,11 @@ if TYPE_CHECKING:
     from collections.abc import Generator
 
 
-@pytest.fixture
-def tmp_ome_zarr(tmp_path: Path) -> Generator[Path, None, None]:
-    """Create a temporary OME-Zarr file for testing."""
+@pytest.fixture(scope="session")
+def tmp_ome_zarr(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Create a temporary OME-Zarr file for testing (shared and read-only)."""
     # Create small test data (2 channels, 5 z-slices, 10x10 pixels)
-    data = np.random.randint(0, 255, size=(2, 5, 10, 10), dtype=np.uint8)
+    data = np.random.default_rng(0).integers(0, 255, size=(2, 5, 10, 10), dtype=np.uint8)
     dims = ["c", "z", "y", "x"]
     scale = {"c": 1.0, "z": 0.5, "y": 0.25, "x": 0.25}
     translation = {"c": 0.0, "z": 0.0, "y": 0.0, "x": 0.0}
@@ -36,16 +36,18 @@ def tmp_ome_zarr(tmp_path: Path) -> Generator[Path, None, None]:
     # Create multiscales with 2 additional downsampled levels
     multiscales = to_multiscales(ngff_image, scale_factors=[2, 4])
 
-    # Write to temporary path
-    output_path = tmp_path / "test.ome.zarr"
-    to_ngff_zarr(str(output_path), multiscales)
+    # Write to temporary path uncompressed; the writer tests cover the compressed path
+    output_path = tmp_path_factory.mktemp("ome_zarr") / "test.ome.zarr"
+    to_ngff_zarr(str(output_path), multiscales, compressor=None)
 
     yield output_path
 
 
-@pytest.fixture
-def tmp_ome_zarr_single_scale(tmp_path: Path) -> Generator[Path, None, None]:
-    """Create a temporary single-scale OME-Zarr file for testing."""
+@pytest.fixture(scope="session")
+def tmp_ome_zarr_single_scale(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Path, None, None]:
+    """Create a temporary single-scale OME-Zarr file for testing (shared and read-only)."""
     # Create small test data (single z-slice, 8x8 pixels)
     data = np.arange(64, dtype=np.float32).reshape(8, 8)
     dims = ["y", "x"]
@@ -65,16 +67,18 @@ def tmp_ome_zarr_single_scale(tmp_path: Path) -> Generator[Path, None, None]:
     multiscales = to_multiscales(ngff_image, scale_factors=[])
 
     # Write to temporary path
-    output_path = tmp_path / "single_scale.ome.zarr"
-    to_ngff_zarr(str(output_path), multiscales)
+    output_path = tmp_path_factory.mktemp("ome_zarr_single_scale") / "single_scale.ome.zarr"
+    to_ngff_zarr(str(output_path), multiscales, compressor=None)
 
     yield output_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_3d() -> np.ndarray:
-    """Create sample 3D data for testing."""
-    return np.random.randint(0, 100, size=(5, 10, 10), dtype=np.uint16)
+    """Create sample 3D data for testing (shared and read-only)."""
+    data = np.random.default_rng(0).integers(0, 100, size=(5, 10, 10), dtype=np.uint16)
+    data.flags.writeable = False
+    return data
 
 
 @pytest.fixture
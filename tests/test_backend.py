@@ -1,5 +1,7 @@
 """Tests for xarray backend integration."""
 
+import subprocess
+import sys
 from pathlib import Path
 
 import xarray as xr
@@ -16,11 +18,20 @@ def test_backend_registered() -> None:
     assert backend.description == "Open OME-Zarr (OME-NGFF) files in xarray"
 
 
+def test_backend_import_is_lightweight() -> None:
+    """Test that loading the backend entrypoint does not import ngff-zarr or zarr."""
+    code = (
+        "import sys, xarray_ome.backend; "
+        "assert 'ngff_zarr' not in sys.modules and 'zarr' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_open_dataset_with_backend(tmp_ome_zarr: Path) -> None:
     """Test opening dataset using xarray backend."""
     ds_backend = xr.open_dataset(str(tmp_ome_zarr), engine="ome-zarr")
 
-    data_var_name = list(ds_backend.data_vars.keys())[0]
+    data_var_name = next(iter(ds_backend.data_vars))
 
     assert ds_backend[data_var_name].shape == (2, 5, 10, 10)
     assert "c" in ds_backend.dims
@@ -33,7 +44,7 @@ def test_open_dataset_with_resolution(tmp_ome_zarr: Path) -> None:
     """Test opening specific resolution level using backend."""
     ds = xr.open_dataset(str(tmp_ome_zarr), engine="ome-zarr", resolution=1)
 
-    data_var_name = list(ds.data_vars.keys())[0]
+    data_var_name = next(iter(ds.data_vars))
 
     assert ds[data_var_name].shape == (2, 2, 5, 5)
 
@@ -49,7 +60,7 @@ def test_open_datatree_with_backend(tmp_ome_zarr: Path) -> None:
     scale0 = dt_backend["scale0"].ds
     assert scale0 is not None
 
-    data_var_name = list(scale0.data_vars.keys())[0]
+    data_var_name = next(iter(scale0.data_vars))
     assert scale0[data_var_name].shape == (2, 5, 10, 10)
 
 
@@ -58,8 +69,8 @@ def test_backend_vs_direct_function_dataset(tmp_ome_zarr: Path) -> None:
     ds_backend = xr.open_dataset(str(tmp_ome_zarr), engine="ome-zarr")
     ds_direct = open_ome_dataset(str(tmp_ome_zarr))
 
-    data_var_backend = list(ds_backend.data_vars.keys())[0]
-    data_var_direct = list(ds_direct.data_vars.keys())[0]
+    data_var_backend = next(iter(ds_backend.data_vars))
+    data_var_direct = next(iter(ds_direct.data_vars))
 
     assert ds_backend[data_var_backend].shape == ds_direct[data_var_direct].shape
     assert set(ds_backend.dims) == set(ds_direct.dims)
@@ -79,8 +90,8 @@ def test_backend_vs_direct_function_datatree(tmp_ome_zarr: Path) -> None:
         assert ds_backend is not None
         assert ds_direct is not None
 
-        data_var_backend = list(ds_backend.data_vars.keys())[0]
-        data_var_direct = list(ds_direct.data_vars.keys())[0]
+        data_var_backend = next(iter(ds_backend.data_vars))
+        data_var_direct = next(iter(ds_direct.data_vars))
 
         assert ds_backend[data_var_backend].shape == ds_direct[data_var_direct].shape
 
@@ -88,7 +99,7 @@ def test_backend_vs_direct_function_datatree(tmp_ome_zarr: Path) -> None:
 def test_drop_variables_dataset(tmp_ome_zarr: Path) -> None:
     """Test drop_variables parameter with dataset."""
     ds_full = xr.open_dataset(str(tmp_ome_zarr), engine="ome-zarr")
-    data_var_name = list(ds_full.data_vars.keys())[0]
+    data_var_name = next(iter(ds_full.data_vars))
 
     ds_dropped = xr.open_dataset(str(tmp_ome_zarr), engine="ome-zarr", drop_variables=data_var_name)
 
@@ -101,7 +112,7 @@ def test_drop_variables_datatree(tmp_ome_zarr: Path) -> None:
     dt_full = xr.open_datatree(str(tmp_ome_zarr), engine="ome-zarr")
     scale0_full = dt_full["scale0"].ds
     assert scale0_full is not None
-    data_var_name = list(scale0_full.data_vars.keys())[0]
+    data_var_name = next(iter(scale0_full.data_vars))
 
     dt_dropped = xr.open_datatree(
         str(tmp_ome_zarr), engine="ome-zarr", drop_variables=data_var_name
@@ -110,6 +121,16 @@ def test_drop_variables_datatree(tmp_ome_zarr: Path) -> None:
     for name, child in dt_dropped.children.items():
         if child.ds is not None:
             assert data_var_name not in child.ds.data_vars
+    assert set(dt_dropped.children) == set(dt_full.children)
+    assert "ome_ngff_metadata" in dt_dropped.attrs
+
+
+def test_drop_variables_datatree_no_match(tmp_ome_zarr: Path) -> None:
+    """Test that drop_variables naming no variable leaves the datatree intact."""
+    dt_full = xr.open_datatree(str(tmp_ome_zarr), engine="ome-zarr")
+    dt = xr.open_datatree(str(tmp_ome_zarr), engine="ome-zarr", drop_variables="missing")
+
+    xr.testing.assert_identical(dt, dt_full)
 
 
 def test_guess_can_open(tmp_ome_zarr: Path) -> None:
@@ -121,6 +142,7 @@ def test_guess_can_open(tmp_ome_zarr: Path) -> None:
     assert backend.guess_can_open(str(tmp_ome_zarr)) is True
     assert backend.guess_can_open("file.ome.zarr") is True
     assert backend.guess_can_open("file.zarr") is True
+    assert backend.guess_can_open("s3://bucket/file.ome.zarr/") is True
     assert backend.guess_can_open("file.nc") is False
     assert backend.guess_can_open(tmp_ome_zarr) is True
 
@@ -129,7 +151,7 @@ def test_single_scale_dataset(tmp_ome_zarr_single_scale: Path) -> None:
     """Test opening single-resolution file without specifying resolution."""
     ds = xr.open_dataset(str(tmp_ome_zarr_single_scale), engine="ome-zarr")
 
-    data_var_name = list(ds.data_vars.keys())[0]
+    data_var_name = next(iter(ds.data_vars))
     assert ds[data_var_name].shape == (8, 8)
     assert "y" in ds.dims
     assert "x" in ds.dims
@@ -145,5 +167,5 @@ def test_single_scale_datatree(tmp_ome_zarr_single_scale: Path) -> None:
     scale0 = dt["scale0"].ds
     assert scale0 is not None
 
-    data_var_name = list(scale0.data_vars.keys())[0]
+    data_var_name = next(iter(scale0.data_vars))
     assert scale0[data_var_name].shape == (8, 8)
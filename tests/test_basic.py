@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -9,7 +10,7 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from xarray_ome import open_ome_dataset, open_ome_datatree
+from xarray_ome import clear_cache, open_ome_dataset, open_ome_datatree, write_ome_dataset
 
 if TYPE_CHECKING:
     pass
@@ -96,7 +97,7 @@ def test_open_ome_dataset_specific_resolution(tmp_ome_zarr: Path) -> None:
     ds = open_ome_dataset(str(tmp_ome_zarr), resolution=1)
 
     # Get data variable name
-    data_var_name = list(ds.data_vars.keys())[0]
+    data_var_name = next(iter(ds.data_vars))
 
     # Check it's downsampled
     assert ds[data_var_name].shape[0] == 2  # c dimension same
@@ -143,7 +144,7 @@ def test_lazy_loading(tmp_ome_zarr: Path) -> None:
     ds = open_ome_dataset(str(tmp_ome_zarr))
 
     # Get data variable name
-    data_var_name = list(ds.data_vars.keys())[0]
+    data_var_name = next(iter(ds.data_vars))
 
     # Data should be a Dask array
     data_array = ds[data_var_name]
@@ -151,23 +152,139 @@ def test_lazy_loading(tmp_ome_zarr: Path) -> None:
 
     # Compute a subset
     subset = data_array.isel(c=0, z=0).compute()
-    assert isinstance(subset.values, np.ndarray)
+    assert isinstance(subset.data, np.ndarray)
     assert subset.shape == (10, 10)
 
 
 def test_single_scale_file(tmp_ome_zarr_single_scale: Path) -> None:
     """Test opening a single-scale OME-Zarr file."""
-    ds = open_ome_dataset(str(tmp_ome_zarr_single_scale))
+    dt = open_ome_datatree(str(tmp_ome_zarr_single_scale))
+
+    # DataTree should have only one scale
+    assert len(dt.children) == 1
+    assert "scale0" in dt.children
+
+    ds = dt["scale0"].ds
 
     # Get data variable name
-    data_var_name = list(ds.data_vars.keys())[0]
+    data_var_name = next(iter(ds.data_vars))
 
     # Check dimensions
     assert ds[data_var_name].shape == (8, 8)
     assert "y" in ds.dims
     assert "x" in ds.dims
 
-    # DataTree should have only one scale
-    dt = open_ome_datatree(str(tmp_ome_zarr_single_scale))
-    assert len(dt.children) == 1
-    assert "scale0" in dt.children
+
+def test_reopen_reuses_metadata(tmp_ome_zarr: Path) -> None:
+    """Test that opening the same store again reuses the parsed multiscales."""
+    from xarray_ome.reader import _read_multiscales
+
+    clear_cache()
+    open_ome_datatree(str(tmp_ome_zarr))
+    ds = open_ome_dataset(str(tmp_ome_zarr), resolution=1)
+
+    assert _read_multiscales.cache_info().hits == 1
+    assert ds[next(iter(ds.data_vars))].shape == (2, 2, 5, 5)
+
+
+def test_reopen_without_metadata_key_is_not_cached(
+    tmp_ome_zarr: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a store whose changes cannot be detected is read again on every open."""
+    from xarray_ome import reader
+
+    clear_cache()
+    monkeypatch.setattr(reader, "_metadata_key", lambda path: None)
+    open_ome_datatree(str(tmp_ome_zarr))
+    open_ome_dataset(str(tmp_ome_zarr))
+
+    assert reader._read_multiscales.cache_info().currsize == 0
+
+
+def _set_store_times(path: Path) -> None:
+    """Give every file of a store the same timestamps, as on a coarse-mtime filesystem."""
+    for root, _, files in os.walk(path):
+        for name in files:
+            os.utime(os.path.join(root, name), (0, 0))
+
+
+def test_reopen_after_overwrite(tmp_path: Path) -> None:
+    """Test that a rewritten local store is read again rather than served from cache."""
+    path = tmp_path / "overwritten.ome.zarr"
+    coords = {"y": np.arange(4.0), "x": np.arange(4.0)}
+    write_ome_dataset(xr.Dataset({"image": (("y", "x"), np.zeros((4, 4)))}, coords=coords), path)
+    _set_store_times(path)
+    assert open_ome_dataset(path)["image"].shape == (4, 4)
+
+    coords = {"y": np.arange(6.0), "x": np.arange(6.0)}
+    write_ome_dataset(xr.Dataset({"image": (("y", "x"), np.zeros((6, 6)))}, coords=coords), path)
+    _set_store_times(path)
+    assert open_ome_dataset(path)["image"].shape == (6, 6)
+
+
+def test_reopen_after_editing_attrs(tmp_ome_zarr: Path) -> None:
+    """Test that editing an opened dataset's attrs in place does not affect later opens."""
+    clear_cache()
+    ds = open_ome_dataset(str(tmp_ome_zarr))
+    ds.attrs["ome_scale"]["x"] = 100.0
+    ds.attrs["ome_translation"]["x"] = 100.0
+
+    ds = open_ome_dataset(str(tmp_ome_zarr))
+    assert ds.attrs["ome_scale"]["x"] == 0.25
+    assert ds.attrs["ome_translation"]["x"] == 0.0
+    np.testing.assert_allclose(ds["x"].values[:2], [0.0, 0.25])
+
+
+def test_reopen_after_editing_metadata(tmp_ome_zarr: Path) -> None:
+    """Test that editing the opened OME-NGFF metadata in place does not affect later opens."""
+    clear_cache()
+    dt = open_ome_datatree(str(tmp_ome_zarr))
+    dt.attrs["ome_ngff_metadata"]["name"] = "edited"
+    dt.attrs["ome_ngff_metadata"]["datasets"].pop()
+
+    ds = open_ome_dataset(str(tmp_ome_zarr))
+    assert ds.attrs["ome_ngff_metadata"]["name"] != "edited"
+    assert len(ds.attrs["ome_ngff_metadata"]["datasets"]) == 3
+
+
+def test_metadata_to_dict_matches_asdict(tmp_ome_zarr: Path) -> None:
+    """Test that metadata conversion gives the same dict as dataclasses.asdict."""
+    from dataclasses import asdict
+
+    from ngff_zarr import from_ngff_zarr
+
+    from xarray_ome.reader import _metadata_to_dict
+
+    metadata = from_ngff_zarr(str(tmp_ome_zarr)).metadata
+    assert _metadata_to_dict(metadata) == asdict(metadata)
+
+
+def test_extract_channel_labels_fallback() -> None:
+    """Test that unlabeled or malformed channels fall back to index-based labels."""
+    from xarray_ome.reader import _extract_channel_labels
+
+    metadata = {"omero": {"channels": [{"label": "DAPI"}, {"label": ""}, {}, "GFP"]}}
+
+    assert _extract_channel_labels(metadata) == ["DAPI", "channel_1", "channel_2", "channel_3"]
+    assert _extract_channel_labels(metadata, expected_size=3) is None
+
+
+def test_channel_labels_independent_per_level(tmp_path: Path) -> None:
+    """Test that editing one level's channel labels leaves other levels unchanged."""
+    import zarr
+    from ngff_zarr import to_multiscales, to_ngff_image, to_ngff_zarr
+
+    path = tmp_path / "labeled.ome.zarr"
+    image = to_ngff_image(np.zeros((2, 8, 8), dtype=np.uint8), dims=["c", "y", "x"])
+    to_ngff_zarr(str(path), to_multiscales(image, scale_factors=[2]), version="0.4")
+    window = {"min": 0, "max": 255, "start": 0, "end": 255}
+    zarr.open_group(str(path), mode="r+").attrs["omero"] = {
+        "channels": [
+            {"label": label, "color": "FFFFFF", "window": window} for label in ("DAPI", "GFP")
+        ]
+    }
+
+    dt = open_ome_datatree(path)
+    dt["scale0"].attrs["ome_channel_labels"][0] = "edited"
+
+    assert dt["scale1"].attrs["ome_channel_labels"] == ["DAPI", "GFP"]
@@ -1,5 +1,7 @@
 """Integration tests with real OME-NGFF sample data."""
 
+from __future__ import annotations
+
 import pytest
 import xarray as xr
 
@@ -9,6 +11,12 @@ from xarray_ome import open_ome_dataset, open_ome_datatree
 IDR_SAMPLE_URL = "https://uk1s3.embassy.ebi.ac.uk/idr/zarr/v0.4/idr0062A/6001240.zarr"
 
 
+@pytest.fixture(scope="module")
+def idr_datatree() -> xr.DataTree:
+    """Open the IDR sample once and share it across read-only tests."""
+    return open_ome_datatree(IDR_SAMPLE_URL)
+
+
 @pytest.mark.slow
 def test_open_dataset_from_idr() -> None:
     """Test opening real OME-NGFF data from IDR using open_ome_dataset."""
@@ -24,9 +32,9 @@ def test_open_dataset_from_idr() -> None:
 
 
 @pytest.mark.slow
-def test_open_datatree_from_idr() -> None:
+def test_open_datatree_from_idr(idr_datatree: xr.DataTree) -> None:
     """Test opening real OME-NGFF data from IDR using open_ome_datatree."""
-    dt = open_ome_datatree(IDR_SAMPLE_URL)
+    dt = idr_datatree
 
     assert set(dt.children.keys()) == {"scale0", "scale1", "scale2"}
 
@@ -74,9 +82,9 @@ def test_backend_with_idr_datatree() -> None:
 
 
 @pytest.mark.slow
-def test_idr_data_coordinates() -> None:
+def test_idr_data_coordinates(idr_datatree: xr.DataTree) -> None:
     """Test that physical coordinates are correctly extracted from IDR data."""
-    ds = open_ome_dataset(IDR_SAMPLE_URL)
+    ds = idr_datatree["scale0"].ds
 
     assert "c" in ds.coords
     assert "z" in ds.coords
@@ -105,5 +113,5 @@ def test_idr_lazy_loading() -> None:
     subset = ds["image"].isel(c=0, z=0)
     assert isinstance(subset.data, da.Array)
 
-    computed = subset.compute()
+    computed = subset.data.compute()
     assert computed.shape == (275, 271)
@@ -0,0 +1,123 @@
+"""Tests for OME-Zarr store type detection."""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+import zarr
+
+from xarray_ome import _store_utils
+from xarray_ome._store_utils import _detect_store_type, _detect_store_type_cached, _metadata_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+requires_jsonschema = pytest.mark.skipif(
+    importlib.util.find_spec("jsonschema") is None,
+    reason="ngff-zarr metadata validation requires jsonschema",
+)
+
+PLATE_ATTRS = {
+    "plate": {
+        "columns": [{"name": "1"}],
+        "rows": [{"name": "A"}],
+        "wells": [{"path": "A/1", "rowIndex": 0, "columnIndex": 0}],
+        "version": "0.4",
+    }
+}
+
+
+@requires_jsonschema
+def test_detect_store_type_plate(tmp_path: Path) -> None:
+    """Test that an HCS plate store is detected."""
+    path = tmp_path / "plate.ome.zarr"
+    zarr.open_group(str(path), mode="w").attrs.update(PLATE_ATTRS)
+
+    assert _detect_store_type(str(path)) == "hcs"
+
+
+def test_detect_store_type_missing_store(tmp_path: Path) -> None:
+    """Test that a path without a zarr store is reported as unknown."""
+    assert _detect_store_type(str(tmp_path / "missing.zarr")) == "unknown"
+
+
+@requires_jsonschema
+def test_detect_store_type_is_cached(tmp_path: Path) -> None:
+    """Test that repeated detection on an unchanged store hits the cache."""
+    path = tmp_path / "plate.ome.zarr"
+    zarr.open_group(str(path), mode="w").attrs.update(PLATE_ATTRS)
+
+    _detect_store_type(str(path))
+    hits = _detect_store_type_cached.cache_info().hits
+    assert _detect_store_type(str(path)) == "hcs"
+    assert _detect_store_type_cached.cache_info().hits == hits + 1
+
+
+@requires_jsonschema
+def test_detect_store_type_image(tmp_ome_zarr: Path) -> None:
+    """Test that a multiscale image store is detected."""
+    assert _detect_store_type(str(tmp_ome_zarr)) == "image"
+
+
+@requires_jsonschema
+def test_detect_store_type_reads_attrs_only(
+    tmp_ome_zarr: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that detection never loads the image pyramid or plate structure."""
+    import ngff_zarr
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("store type detection must not load the store")
+
+    monkeypatch.setattr(ngff_zarr, "from_ngff_zarr", fail)
+    monkeypatch.setattr(ngff_zarr, "from_hcs_zarr", fail)
+    _detect_store_type_cached.cache_clear()
+
+    assert _detect_store_type(str(tmp_ome_zarr)) == "image"
+
+
+class _FakeResponse:
+    def __init__(self, ok: bool, headers: dict[str, str]) -> None:
+        self.ok = ok
+        self.headers = headers
+
+
+def test_metadata_key_remote_uses_validator(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an HTTP store is keyed on the validator of its group metadata."""
+    etags = {"https://example.com/image.zarr/.zattrs": '"v1"'}
+
+    def head(url: str, **kwargs: object) -> _FakeResponse:
+        if url in etags:
+            return _FakeResponse(True, {"ETag": etags[url]})
+        return _FakeResponse(False, {})
+
+    monkeypatch.setattr(_store_utils.requests, "head", head)
+    key = _metadata_key("https://example.com/image.zarr/")
+    assert key == (b'"v1"',)
+
+    etags["https://example.com/image.zarr/.zattrs"] = '"v2"'
+    assert _metadata_key("https://example.com/image.zarr") != key
+
+
+def test_metadata_key_remote_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an HTTP store without a reachable validator has no key."""
+
+    def head(url: str, **kwargs: object) -> _FakeResponse:
+        raise requests.ConnectionError
+
+    monkeypatch.setattr(_store_utils.requests, "head", head)
+    assert _metadata_key("https://example.com/image.zarr") is None
+
+
+def test_detect_store_type_without_key_is_not_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a store without a metadata key bypasses the cache."""
+    monkeypatch.setattr(_store_utils, "_metadata_key", lambda path: None)
+    _detect_store_type_cached.cache_clear()
+
+    assert _detect_store_type(str(tmp_path / "missing.zarr")) == "unknown"
+    assert _detect_store_type_cached.cache_info().currsize == 0
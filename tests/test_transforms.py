@@ -46,6 +46,14 @@ def test_transforms_to_coords_with_translation() -> None:
     np.testing.assert_allclose(coords["x"], [10.0, 12.0, 14.0])
 
 
+def test_transforms_to_coords_integer_transforms_are_float() -> None:
+    """Test that integer scale and translation still give float64 coordinates."""
+    coords = transforms_to_coords((3,), ["x"], {"x": 1}, {"x": 0})
+
+    assert coords["x"].dtype == np.float64
+    np.testing.assert_array_equal(coords["x"], [0.0, 1.0, 2.0])
+
+
 def test_transforms_to_coords_missing_dimension() -> None:
     """Test that missing dimensions default to scale=1.0, translation=0.0."""
     shape = (5,)
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 import xarray as xr
 
 from xarray_ome import (
@@ -67,7 +68,7 @@ def test_write_ome_dataset_with_scale_factors(
     assert "scale2" in dt.children
 
     # Get data variable name
-    data_var_name = list(dt["scale0"].ds.data_vars.keys())[0]
+    data_var_name = next(iter(dt["scale0"].ds.data_vars))
 
     # Check sizes decrease
     shape0 = dt["scale0"].ds[data_var_name].shape
@@ -118,13 +119,11 @@ def test_roundtrip_dataset(tmp_ome_zarr: Path, tmp_path: Path) -> None:
     ds2 = open_ome_dataset(str(output_path))
 
     # Get data variable names
-    data_var_name1 = list(ds1.data_vars.keys())[0]
-    data_var_name2 = list(ds2.data_vars.keys())[0]
+    data_var_name1 = next(iter(ds1.data_vars))
+    data_var_name2 = next(iter(ds2.data_vars))
 
-    # Check data matches (compute to compare actual values)
-    data1 = ds1[data_var_name1].compute()
-    data2 = ds2[data_var_name2].compute()
-    np.testing.assert_array_equal(data1.values, data2.values)
+    # Check data matches (compared chunk by chunk, without loading both arrays)
+    xr.testing.assert_equal(ds1[data_var_name1].variable, ds2[data_var_name2].variable)
 
     # Check metadata
     assert ds2.attrs["ome_scale"] == ds1.attrs["ome_scale"]
@@ -149,13 +148,57 @@ def test_roundtrip_datatree(tmp_ome_zarr: Path, tmp_path: Path) -> None:
         ds2 = dt2[scale_name].ds
 
         # Get data variable names
-        data_var_name1 = list(ds1.data_vars.keys())[0]
-        data_var_name2 = list(ds2.data_vars.keys())[0]
+        data_var_name1 = next(iter(ds1.data_vars))
+        data_var_name2 = next(iter(ds2.data_vars))
 
-        # Compute and compare data
-        data1 = ds1[data_var_name1].compute()
-        data2 = ds2[data_var_name2].compute()
-        np.testing.assert_array_equal(data1.values, data2.values)
+        # Compare data chunk by chunk
+        xr.testing.assert_equal(ds1[data_var_name1].variable, ds2[data_var_name2].variable)
+
+        # Each level keeps its own transforms
+        assert ds2.attrs["ome_scale"] == pytest.approx(ds1.attrs["ome_scale"])
+        assert ds2.attrs["ome_translation"] == pytest.approx(ds1.attrs["ome_translation"])
+
+
+def test_write_datatree_custom_level_transforms(tmp_path: Path) -> None:
+    """Test that levels keep transforms that differ from ngff-zarr's half-pixel convention."""
+    dt = xr.DataTree.from_dict(
+        {
+            "scale0": xr.Dataset(
+                {"image": (("y", "x"), np.zeros((8, 8)))},
+                coords={"y": np.arange(8.0), "x": np.arange(8.0)},
+            ),
+            "scale1": xr.Dataset(
+                {"image": (("y", "x"), np.ones((4, 4)))},
+                coords={"y": np.arange(4.0) * 2, "x": np.arange(100.0, 104.0)},
+            ),
+        }
+    )
+
+    output_path = tmp_path / "custom_transforms.ome.zarr"
+    write_ome_datatree(dt, str(output_path))
+
+    dt_written = open_ome_datatree(str(output_path))
+    for scale_name in ("scale0", "scale1"):
+        ds = dt_written[scale_name].ds
+        np.testing.assert_allclose(ds["y"].values, dt[scale_name]["y"].values)
+        np.testing.assert_allclose(ds["x"].values, dt[scale_name]["x"].values)
+
+
+def test_write_datatree_level_larger_than_base(tmp_path: Path) -> None:
+    """Test writing a tree whose later level is larger than scale0."""
+    dt = xr.DataTree.from_dict(
+        {
+            "scale0": xr.Dataset({"image": (("y", "x"), np.zeros((4, 4)))}),
+            "scale1": xr.Dataset({"image": (("y", "x"), np.zeros((8, 8)))}),
+        }
+    )
+
+    output_path = tmp_path / "larger_level.ome.zarr"
+    write_ome_datatree(dt, str(output_path))
+
+    dt_written = open_ome_datatree(str(output_path))
+    ds = dt_written["scale1"].ds
+    assert ds[next(iter(ds.data_vars))].shape == (8, 8)
 
 
 def test_write_preserves_metadata(tmp_ome_zarr: Path, tmp_path: Path) -> None:
@@ -186,12 +229,57 @@ def test_write_custom_chunks(tmp_ome_zarr_single_scale: Path, tmp_path: Path) ->
     ds_written = open_ome_dataset(str(output_path))
 
     # Get data variable names
-    data_var_name = list(ds.data_vars.keys())[0]
-    data_var_name_written = list(ds_written.data_vars.keys())[0]
+    data_var_name = next(iter(ds.data_vars))
+    data_var_name_written = next(iter(ds_written.data_vars))
 
     assert ds_written[data_var_name_written].shape == ds[data_var_name].shape
 
 
+def test_write_datatree_custom_chunks(tmp_ome_zarr: Path, tmp_path: Path) -> None:
+    """Test that write_ome_datatree chunks every level with the given chunks."""
+    dt = open_ome_datatree(str(tmp_ome_zarr))
+
+    output_path = tmp_path / "custom_chunks.ome.zarr"
+    chunks = (1, 1, 4, 4)
+    write_ome_datatree(dt, str(output_path), chunks=chunks)
+
+    dt_written = open_ome_datatree(str(output_path))
+    for scale_name in dt_written.children:
+        ds = dt_written[scale_name].ds
+        data = ds[next(iter(ds.data_vars))].data
+        assert data.chunksize == tuple(min(c, n) for c, n in zip(chunks, data.shape))
+
+
+def test_write_datatree_many_chunks_skips_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a tree of many-chunk dask levels is not serialized to ngff-zarr's cache."""
+    import sys
+
+    import dask.array as da
+    from ngff_zarr import config
+
+    def fail(*args: object, **kwargs: object) -> None:
+        msg = "scale0 was serialized to the ngff-zarr cache"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(sys.modules["ngff_zarr.to_multiscales"], "_large_image_serialization", fail)
+    # Stand in for a task count above ngff-zarr's default threshold of 50000
+    monkeypatch.setattr(config, "task_target", 10)
+
+    children = {}
+    for i, size in enumerate((16, 8)):
+        coords = {"y": np.arange(size) * 2.0**i, "x": np.arange(size) * 2.0**i}
+        data = da.zeros((size, size), chunks=2, dtype=np.uint8)
+        children[f"scale{i}"] = xr.DataTree(xr.Dataset({"image": (("y", "x"), data)}, coords))
+
+    output_path = tmp_path / "many_chunks.ome.zarr"
+    write_ome_datatree(xr.DataTree(children=children), output_path)
+
+    ds = open_ome_dataset(output_path, resolution=1)
+    assert ds["image"].shape == (8, 8)
+
+
 def test_write_from_computed_data(tmp_path: Path) -> None:
     """Test writing from computed (non-lazy) data."""
     # Create a simple dataset with computed data
@@ -1,17 +1,42 @@
 """xarray-ome: OME integration for xarray."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 try:
     from ._version import __version__
 except ImportError:
     __version__ = "unknown"
 
-from .reader import open_ome_dataset, open_ome_datatree
-from .writer import write_ome_dataset, write_ome_datatree
+if TYPE_CHECKING:
+    from .reader import clear_cache, open_ome_dataset, open_ome_datatree
+    from .writer import write_ome_dataset, write_ome_datatree
+
+# Public functions are imported on first access so that loading the xarray
+# backend entrypoint (xarray_ome.backend) does not import ngff-zarr and zarr.
+_LAZY_IMPORTS = {
+    "clear_cache": ".reader",
+    "open_ome_dataset": ".reader",
+    "open_ome_datatree": ".reader",
+    "write_ome_dataset": ".writer",
+    "write_ome_datatree": ".writer",
+}
 
 __all__ = [
     "__version__",
+    "clear_cache",
     "open_ome_datatree",
     "open_ome_dataset",
     "write_ome_datatree",
     "write_ome_dataset",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -2,8 +2,91 @@
 
 from __future__ import annotations
 
+import json
+import os
+from functools import lru_cache
 from typing import Any
 
+import requests
+import zarr
+from ngff_zarr import validate  # type: ignore[import-untyped]
+
+_METADATA_FILES = ("zarr.json", ".zattrs")
+_ARRAY_METADATA_FILES = ("zarr.json", ".zarray")
+_HTTP_SCHEMES = ("http://", "https://")
+_HEAD_TIMEOUT = 10
+
+# (top-level metadata key, ngff-zarr validation model, store type)
+_MODELS_BY_KEY = (
+    ("plate", "plate", "hcs"),
+    ("well", "well", "hcs"),
+    ("multiscales", "image", "image"),
+)
+
+
+def _metadata_key(path: str) -> tuple[bytes, ...] | None:
+    """Return a key that changes whenever the metadata of a store changes.
+
+    For a local store this is the group metadata together with the array
+    metadata of each multiscale level, so a store rewritten in place gets a new
+    key even when the filesystem's modification time resolution cannot tell
+    the two writes apart. For an HTTP(S) store it is the ETag or Last-Modified
+    validator of the group metadata.
+
+    Returns None when no key can be determined (other URL schemes, servers
+    without validators, or paths without zarr group metadata). Such stores
+    must not be served from a cache.
+    """
+    if path.startswith(_HTTP_SCHEMES):
+        return _remote_metadata_key(path)
+
+    group_metadata = _read_first(path, _METADATA_FILES)
+    if group_metadata is None:
+        return None
+    arrays_metadata = (
+        _read_first(os.path.join(path, dataset_path), _ARRAY_METADATA_FILES)
+        for dataset_path in _dataset_paths(group_metadata)
+    )
+    return (group_metadata, *(m for m in arrays_metadata if m is not None))
+
+
+def _remote_metadata_key(url: str) -> tuple[bytes, ...] | None:
+    """Return the ETag or Last-Modified validator of a remote store's group metadata."""
+    for name in _METADATA_FILES:
+        try:
+            response = requests.head(
+                f"{url.rstrip('/')}/{name}", allow_redirects=True, timeout=_HEAD_TIMEOUT
+            )
+        except requests.RequestException:
+            return None
+        if response.ok:
+            validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+            return (validator.encode(),) if validator else None
+    return None
+
+
+def _read_first(directory: str, names: tuple[str, ...]) -> bytes | None:
+    """Return the contents of the first of ``names`` that exists in ``directory``."""
+    for name in names:
+        try:
+            with open(os.path.join(directory, name), "rb") as f:
+                return f.read()
+        except OSError:
+            continue
+    return None
+
+
+def _dataset_paths(group_metadata: bytes) -> list[str]:
+    """Return the dataset paths of the first multiscale in raw group metadata."""
+    try:
+        attrs = json.loads(group_metadata)
+        # zarr v3 nests the attributes, and NGFF v0.5 nests them again under "ome"
+        attrs = attrs.get("attributes", attrs)
+        attrs = attrs.get("ome", attrs)
+        return [str(dataset["path"]) for dataset in attrs["multiscales"][0]["datasets"]]
+    except (ValueError, TypeError, LookupError, AttributeError):
+        return []
+
 
 def _detect_store_type(path: str) -> str:
     """
@@ -21,33 +104,38 @@ def _detect_store_type(path: str) -> str:
 
     Notes
     -----
-    Uses ngff-zarr's validate function to attempt validation against
-    different OME-NGFF models (image, plate, well).
+    Picks the OME-NGFF model (image, plate, well) from the top-level
+    metadata key and validates against it with ngff-zarr's validate function.
+
+    Results are cached per path and are re-inspected when the store's
+    metadata changes. Stores whose changes cannot be detected are not cached.
     """
-    try:
-        import zarr
-        from ngff_zarr import validate  # type: ignore[import-untyped]
+    metadata_key = _metadata_key(path)
+    if metadata_key is None:
+        return _inspect_store_type(path)
+    return _detect_store_type_cached(path, metadata_key)
 
-        store = zarr.open(path, mode="r")
-        attrs: dict[str, Any] = dict(store.attrs.asdict())
 
-        try:
-            validate(attrs, model="image")
-            return "image"
-        except Exception:
-            pass
+@lru_cache(maxsize=128)
+def _detect_store_type_cached(path: str, metadata_key: tuple[bytes, ...]) -> str:
+    """Detect the store type; ``metadata_key`` only participates in the cache key."""
+    return _inspect_store_type(path)
 
-        try:
-            validate(attrs, model="plate")
-            return "hcs"
-        except Exception:
-            pass
 
-        try:
-            validate(attrs, model="well")
-            return "hcs"
-        except Exception:
-            pass
+def _inspect_store_type(path: str) -> str:
+    """Detect the store type without consulting the cache."""
+    try:
+        store = zarr.open(path, mode="r")
+        attrs: dict[str, Any] = dict(store.attrs.asdict())
+
+        # NGFF metadata identifies itself by its top-level key (nested under
+        # "ome" from v0.5), so only the matching model needs validating.
+        ome_attrs = attrs.get("ome", attrs)
+        version = ome_attrs.get("version", "0.4") if "ome" in attrs else "0.4"
+        for key, model, store_type in _MODELS_BY_KEY:
+            if key in ome_attrs:
+                validate(attrs, version=version, model=model)
+                return store_type
 
         return "unknown"
     except Exception:
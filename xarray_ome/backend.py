@@ -8,12 +8,12 @@ from typing import TYPE_CHECKING, Any
 
 from xarray.backends import BackendEntrypoint
 
-from xarray_ome.reader import open_ome_dataset, open_ome_datatree
-
 if TYPE_CHECKING:
     from xarray.core.dataset import Dataset
     from xarray.core.datatree import DataTree
 
+_ZARR_SUFFIXES = (".zarr", ".zarr/")
+
 
 class OmeZarrBackendEntrypoint(BackendEntrypoint):
     """Xarray backend for reading OME-Zarr files.
@@ -60,7 +60,9 @@ class OmeZarrBackendEntrypoint(BackendEntrypoint):
         Dataset
             Dataset containing the requested resolution level.
         """
-        path = str(filename_or_obj) if isinstance(filename_or_obj, os.PathLike) else filename_or_obj
+        from xarray_ome.reader import open_ome_dataset
+
+        path = os.fspath(filename_or_obj)
         ds = open_ome_dataset(path, resolution=resolution, validate=validate)
 
         if drop_variables is not None:
@@ -91,18 +93,19 @@ class OmeZarrBackendEntrypoint(BackendEntrypoint):
         DataTree
             DataTree containing all resolution levels.
         """
-        path = str(filename_or_obj) if isinstance(filename_or_obj, os.PathLike) else filename_or_obj
+        from xarray_ome.reader import open_ome_datatree
+
+        path = os.fspath(filename_or_obj)
         dt = open_ome_datatree(path, validate=validate)
 
         if drop_variables is not None:
-            if isinstance(drop_variables, str):
-                drop_variables = [drop_variables]
-
-            for node in dt.subtree:
-                if node.ds is not None:
-                    vars_to_drop = [v for v in drop_variables if v in node.ds.data_vars]
-                    if vars_to_drop:
-                        node.ds = node.ds.drop_vars(vars_to_drop)
+            drop_set = frozenset(
+                [drop_variables] if isinstance(drop_variables, str) else drop_variables
+            )
+            if any(not drop_set.isdisjoint(node.data_vars) for node in dt.subtree):
+                dt = dt.map_over_datasets(
+                    lambda ds: ds.drop_vars(drop_set.intersection(ds.data_vars))
+                )
 
         return dt
 
@@ -119,9 +122,9 @@ class OmeZarrBackendEntrypoint(BackendEntrypoint):
         bool
             True if the file appears to be an OME-Zarr store.
         """
-        if isinstance(filename_or_obj, str | os.PathLike):
-            path_str = str(filename_or_obj).rstrip("/")
-            _, ext = os.path.splitext(path_str)
-            return ext in [".zarr"]
+        if isinstance(filename_or_obj, os.PathLike):
+            filename_or_obj = os.fspath(filename_or_obj)
+        if isinstance(filename_or_obj, str):
+            return filename_or_obj.endswith(_ZARR_SUFFIXES)
 
         return False
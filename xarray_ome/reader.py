@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import xarray as xr
-from ngff_zarr import NgffImage, from_ngff_zarr  # type: ignore[import-untyped]
+from ngff_zarr import Multiscales, NgffImage, from_ngff_zarr  # type: ignore[import-untyped]
 
-from ._store_utils import _detect_store_type
+from ._store_utils import _detect_store_type, _detect_store_type_cached, _metadata_key
 from .transforms import transforms_to_coords
 
 if TYPE_CHECKING:
@@ -44,11 +46,60 @@ def open_ome_datatree(path: str | Path, validate: bool = False) -> xr.DataTree:
     Currently only supports simple multiscale images. HCS (High Content Screening)
     plate structures are not yet supported.
     """
+    multiscales = _open_multiscales(str(path), validate)
+
+    # Extract metadata dict for passing to conversion. It is built afresh on
+    # every open, since it ends up in user-mutable attrs
+    metadata_dict = _metadata_to_dict(multiscales.metadata)
+
+    # Channels are never downsampled, so every level shares the same labels
+    channel_labels = _extract_channel_labels(metadata_dict, _channel_size(multiscales.images[0]))
+
+    # Convert each scale level to a Dataset and create child nodes
+    children = {
+        f"scale{i}": xr.DataTree(_ngff_image_to_dataset(ngff_image, metadata_dict, channel_labels))
+        for i, ngff_image in enumerate(multiscales.images)
+    }
+
+    # Create the root DataTree with children
+    dt = xr.DataTree(children=children, name="root")
+
+    # Store the full OME-NGFF metadata in root attrs
+    dt.attrs["ome_ngff_metadata"] = metadata_dict
+
+    return dt
+
+
+def clear_cache() -> None:
+    """Clear the cached OME-Zarr metadata of previously opened stores.
+
+    Stores are identified by path plus the contents of their group and array
+    metadata (local stores) or the ETag/Last-Modified header of their group
+    metadata (HTTP stores), so modified stores are normally re-read on their
+    own. Call this after modifying an HTTP store whose server does not update
+    those headers.
+    """
+    _read_multiscales.cache_clear()
+    _detect_store_type_cached.cache_clear()
+
+
+def _open_multiscales(path: str, validate: bool) -> Multiscales:
+    """Read the multiscales of an OME-Zarr store, reusing earlier reads of the same store.
+
+    Raises
+    ------
+    ValueError
+        If the OME-Zarr store is not a simple multiscale image (e.g., HCS plate)
+    """
     try:
-        multiscales = from_ngff_zarr(str(path), validate=validate)
+        metadata_key = _metadata_key(path)
+        if metadata_key is None:
+            # Without a key a store modified in place cannot be detected, so don't cache it
+            return from_ngff_zarr(path, validate=validate)
+        return _read_multiscales(path, validate, metadata_key)
     except KeyError as e:
         if "multiscales" in str(e):
-            store_type = _detect_store_type(str(path))
+            store_type = _detect_store_type(path)
             if store_type == "hcs":
                 msg = (
                     f"The OME-Zarr store at '{path}' appears to be an HCS (High Content "
@@ -63,23 +114,11 @@ def open_ome_datatree(path: str | Path, validate: bool = False) -> xr.DataTree:
             raise ValueError(msg) from e
         raise
 
-    # Extract metadata dict for passing to conversion
-    metadata_dict = _metadata_to_dict(multiscales.metadata)
-
-    # Convert each scale level to a Dataset and create child nodes
-    children = {}
-    for i, ngff_image in enumerate(multiscales.images):
-        dataset = _ngff_image_to_dataset(ngff_image, metadata_dict)
-        scale_name = f"scale{i}"
-        children[scale_name] = xr.DataTree(dataset, name=scale_name)
-
-    # Create the root DataTree with children
-    dt = xr.DataTree(children=children, name="root")
-
-    # Store the full OME-NGFF metadata in root attrs
-    dt.attrs["ome_ngff_metadata"] = metadata_dict
 
-    return dt
+@lru_cache(maxsize=128)
+def _read_multiscales(path: str, validate: bool, metadata_key: tuple[bytes, ...]) -> Multiscales:
+    """Read the multiscales of a store; ``metadata_key`` only participates in the cache key."""
+    return from_ngff_zarr(path, validate=validate)
 
 
 def _extract_channel_labels(
@@ -121,25 +160,27 @@ def _extract_channel_labels(
     if not channels:
         return None
 
-    channel_labels = []
-    for i, ch in enumerate(channels):
-        if isinstance(ch, dict):
-            label = ch.get("label")
-            if label:
-                channel_labels.append(label)
-            else:
-                channel_labels.append(f"channel_{i}")
-        else:
-            channel_labels.append(f"channel_{i}")
-
-    if expected_size is not None and len(channel_labels) != expected_size:
+    if expected_size is not None and len(channels) != expected_size:
         return None
 
-    return channel_labels if channel_labels else None
+    # Channels without a usable label fall back to their index
+    return [
+        (ch.get("label") if isinstance(ch, dict) else None) or f"channel_{i}"
+        for i, ch in enumerate(channels)
+    ]
+
+
+def _channel_size(ngff_image: NgffImage) -> int | None:
+    """Return the size of the channel dimension, or None if there is none."""
+    if "c" not in ngff_image.dims:
+        return None
+    return int(ngff_image.data.shape[ngff_image.dims.index("c")])
 
 
 def _ngff_image_to_dataset(
-    ngff_image: NgffImage, metadata: dict[str, Any] | None = None
+    ngff_image: NgffImage,
+    metadata: dict[str, Any] | None = None,
+    channel_labels: list[str] | None = None,
 ) -> xr.Dataset:
     """Convert an NgffImage to an xarray Dataset.
 
@@ -149,18 +190,16 @@ def _ngff_image_to_dataset(
         The image to convert
     metadata : dict, optional
         Full OME-NGFF metadata dict containing channel/time labels
+    channel_labels : list of str, optional
+        Channel labels already extracted from ``metadata``. If None, they
+        are extracted here.
     """
     # Get the data array
     data = ngff_image.data
 
-    # Extract channel dimension size for validation
-    channel_size = None
-    if "c" in ngff_image.dims:
-        channel_idx = ngff_image.dims.index("c")
-        channel_size = data.shape[channel_idx]
-
     # Extract channel labels from OME metadata if available
-    channel_labels = _extract_channel_labels(metadata, channel_size)
+    if channel_labels is None:
+        channel_labels = _extract_channel_labels(metadata, _channel_size(ngff_image))
 
     # Could add time labels here in the future if spec is extended
     # For now, time is just numeric per OME-NGFF spec
@@ -184,37 +223,53 @@ def _ngff_image_to_dataset(
         name=ngff_image.name,
     )
 
-    # Create Dataset
-    dataset = xr.Dataset({ngff_image.name: data_array})
-
     # Store scale and translation in attrs for round-tripping
-    dataset.attrs["ome_scale"] = ngff_image.scale
-    dataset.attrs["ome_translation"] = ngff_image.translation
+    attrs: dict[str, Any] = {
+        # Copies, since the NgffImage is shared by every open of a cached store
+        "ome_scale": dict(ngff_image.scale),
+        "ome_translation": dict(ngff_image.translation),
+    }
     if ngff_image.axes_units:
-        dataset.attrs["ome_axes_units"] = dict(ngff_image.axes_units)
+        attrs["ome_axes_units"] = dict(ngff_image.axes_units)
     if ngff_image.axes_orientations:
-        dataset.attrs["ome_axes_orientations"] = {
+        attrs["ome_axes_orientations"] = {
             k: str(v) for k, v in ngff_image.axes_orientations.items()
         }
 
     # Store image name from OME metadata if available
     if metadata and "name" in metadata:
-        dataset.attrs["ome_image_name"] = metadata["name"]
+        attrs["ome_image_name"] = metadata["name"]
 
     # Store channel information for reference
     if channel_labels:
-        dataset.attrs["ome_channel_labels"] = channel_labels
+        # Each level gets its own list so editing one level's labels leaves the rest
+        attrs["ome_channel_labels"] = list(channel_labels)
 
-    return dataset
+    # Create Dataset with all attrs at once
+    return xr.Dataset({ngff_image.name: data_array}, attrs=attrs)
 
 
 def _metadata_to_dict(metadata: Any) -> dict[str, Any]:
     """Convert OME-NGFF metadata to a dictionary."""
-    # For now, use dataclass conversion
-    # This preserves the metadata for round-tripping
-    from dataclasses import asdict
+    result: dict[str, Any] = _to_builtin(metadata)
+    return result
 
-    return asdict(metadata)
+
+def _to_builtin(obj: Any) -> Any:
+    """Recursively convert dataclasses to dicts, like ``dataclasses.asdict``.
+
+    Unlike ``asdict``, leaf values are not deep-copied. Metadata leaves are
+    strings, numbers and enums, so sharing them is safe.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _to_builtin(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, list):
+        return [_to_builtin(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(_to_builtin(v) for v in obj)
+    if isinstance(obj, dict):
+        return {k: _to_builtin(v) for k, v in obj.items()}
+    return obj
 
 
 def open_ome_dataset(path: str | Path, resolution: int = 0, validate: bool = False) -> xr.Dataset:
@@ -249,26 +304,10 @@ def open_ome_dataset(path: str | Path, resolution: int = 0, validate: bool = Fal
     Currently only supports simple multiscale images. HCS (High Content Screening)
     plate structures are not yet supported.
     """
-    try:
-        multiscales = from_ngff_zarr(str(path), validate=validate)
-    except KeyError as e:
-        if "multiscales" in str(e):
-            store_type = _detect_store_type(str(path))
-            if store_type == "hcs":
-                msg = (
-                    f"The OME-Zarr store at '{path}' appears to be an HCS (High Content "
-                    "Screening) plate structure, which is not yet supported. "
-                    "Currently only simple multiscale images are supported."
-                )
-                raise ValueError(msg) from e
-            msg = (
-                f"The OME-Zarr store at '{path}' does not contain multiscale metadata. "
-                "It may be an unsupported OME-Zarr structure."
-            )
-            raise ValueError(msg) from e
-        raise
+    multiscales = _open_multiscales(str(path), validate)
 
-    # Extract metadata dict for passing to conversion
+    # Extract metadata dict for passing to conversion. It is built afresh on
+    # every open, since it ends up in user-mutable attrs
     metadata_dict = _metadata_to_dict(multiscales.metadata)
 
     # Check that resolution level exists
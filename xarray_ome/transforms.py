@@ -40,7 +40,8 @@ def transforms_to_coords(
     Returns
     -------
     dict[str, np.ndarray]
-        Mapping of dimension names to coordinate arrays
+        Mapping of dimension names to coordinate arrays. Numeric coordinates
+        are always float64, even for integer scale and translation values.
 
     Notes
     -----
@@ -75,7 +76,12 @@ def transforms_to_coords(
 
             # Create coordinate array: translation + scale * indices
             # This converts pixel indices to physical coordinates
-            coords[dim] = dim_translation + dim_scale * np.arange(size)
+            values = np.arange(size, dtype=np.float64)
+            if dim_scale != 1.0:
+                values *= dim_scale
+            if dim_translation != 0.0:
+                values += dim_translation
+            coords[dim] = values
 
     return coords
 
@@ -126,7 +132,9 @@ def coords_to_transforms(
 
     for dim in data_array.dims:
         if dim in dataset.coords:
-            coord = dataset.coords[dim].values
+            # Only the first two values are needed, so avoid materializing the
+            # whole coordinate array
+            coord = dataset.coords[dim].variable[:2].values
             if len(coord) > 1:
                 # Calculate scale as spacing between coordinates
                 # Assumes uniform spacing
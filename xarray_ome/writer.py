@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, cast
 
-from ngff_zarr import to_multiscales, to_ngff_image, to_ngff_zarr  # type: ignore[import-untyped]
+from ngff_zarr import (  # type: ignore[import-untyped]
+    NgffImage,
+    to_multiscales,
+    to_ngff_image,
+    to_ngff_zarr,
+)
 
 from .transforms import coords_to_transforms
 
@@ -12,6 +18,10 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     import xarray as xr
+    from ngff_zarr.v04.zarr_metadata import Dataset as DatasetV04  # type: ignore[import-untyped]
+    from ngff_zarr.v06.zarr_metadata import Dataset as DatasetV06  # type: ignore[import-untyped]
+
+_SPATIAL_DIMS = ("x", "y", "z")
 
 
 def write_ome_dataset(
@@ -51,35 +61,7 @@ def write_ome_dataset(
     >>> # With multiscale pyramid
     >>> write_ome_dataset(ds, "output.ome.zarr", scale_factors=[2, 4])
     """
-    # Get the first data variable (assumes single image array)
-    data_var_name = next(iter(dataset.data_vars))
-    data_array = dataset[data_var_name]
-
-    # Extract data and dimensions
-    data = data_array.values
-    dims = list(data_array.dims)
-
-    # Convert coordinates back to OME-NGFF transformations
-    scale, translation = coords_to_transforms(dataset)
-
-    # Convert to string keys for ngff-zarr
-    scale_dict = {str(k): float(v) for k, v in scale.items()}
-    translation_dict = {str(k): float(v) for k, v in translation.items()}
-
-    # Extract axes units and orientations if present
-    axes_units = None
-    if "ome_axes_units" in dataset.attrs:
-        axes_units = dataset.attrs["ome_axes_units"]
-
-    # Create NgffImage
-    ngff_image = to_ngff_image(
-        data,
-        dims=dims,
-        scale=scale_dict,
-        translation=translation_dict,
-        name=data_var_name,
-        axes_units=axes_units,
-    )
+    ngff_image = _dataset_to_ngff_image(dataset, chunks)
 
     # Create multiscales
     kwargs = {}
@@ -135,7 +117,7 @@ def write_ome_datatree(
     """
     # Get scale levels in order
     scale_nodes = sorted(
-        [(int(name.replace("scale", "")), child) for name, child in datatree.children.items()],
+        ((int(name.replace("scale", "")), child) for name, child in datatree.children.items()),
         key=lambda x: x[0],
     )
 
@@ -144,72 +126,98 @@ def write_ome_datatree(
         raise ValueError(msg)
 
     # Convert each scale level to NgffImage
-    ngff_images = []
-    for _, scale_node in scale_nodes:
-        dataset = scale_node.ds
-        if dataset is None:
-            continue
-
-        # Get the first data variable
-        data_var_name = next(iter(dataset.data_vars))
-        data_array = dataset[data_var_name]
-
-        # Extract data and dimensions
-        data = data_array.values
-        dims = list(data_array.dims)
-
-        # Convert coordinates to transforms
-        scale, translation = coords_to_transforms(dataset)
-        scale_dict = {str(k): float(v) for k, v in scale.items()}
-        translation_dict = {str(k): float(v) for k, v in translation.items()}
-
-        # Extract axes units if present
-        axes_units = None
-        if "ome_axes_units" in dataset.attrs:
-            axes_units = dataset.attrs["ome_axes_units"]
-
-        # Create NgffImage
-        ngff_image = to_ngff_image(
-            data,
-            dims=dims,
-            scale=scale_dict,
-            translation=translation_dict,
-            name=data_var_name,
-            axes_units=axes_units,
+    ngff_images = [
+        _dataset_to_ngff_image(scale_node.ds, chunks)
+        for _, scale_node in scale_nodes
+        if scale_node.ds is not None
+    ]
+
+    # Describe the existing pyramid to ngff-zarr by the per-dimension factor each
+    # level was downsampled by relative to scale0, so that it assembles the
+    # dataset metadata (paths and per-level transforms) itself
+    base_image = ngff_images[0]
+    scale_factors = [
+        {
+            dim: max(1, round(base_size / size))
+            for dim, base_size, size in zip(
+                base_image.dims, base_image.data.shape, image.data.shape
+            )
+            if dim in _SPATIAL_DIMS
+        }
+        for image in ngff_images[1:]
+    ]
+    # cache=False: ngff-zarr would otherwise serialize a large scale0 to its
+    # on-disk cache before downsampling, which is wasted since no level is
+    # downsampled here
+    multiscales = to_multiscales(base_image, scale_factors=scale_factors, cache=False)
+
+    # Replace the downsampled levels ngff-zarr generated (never computed) with
+    # the tree's own data; ngff-zarr writes replaced levels as given
+    multiscales.images = ngff_images
+
+    # ngff-zarr derived each level's transforms from its factor; write the
+    # tree's own transforms instead
+    datasets = cast("list[DatasetV04 | DatasetV06]", multiscales.metadata.datasets)
+    for dataset, image in zip(datasets, ngff_images):
+        dataset.coordinateTransformations = _replace_transforms(
+            dataset.coordinateTransformations,
+            scale=[float(image.scale.get(dim, 1.0)) for dim in image.dims],
+            translation=[float(image.translation.get(dim, 0.0)) for dim in image.dims],
         )
-        ngff_images.append(ngff_image)
 
-    # For a DataTree with pre-computed resolution levels, we need to write each
-    # image separately to ensure proper metadata. We'll use to_multiscales with
-    # the original (scale0) image, but specify that the pyramid already exists
-    # by setting scale_factors to match the number of existing scales.
+    # Write to disk
+    to_ngff_zarr(str(path), multiscales)
 
-    # Calculate scale factors from the existing images
-    # If we have 3 images, we might have scale factors like [2, 4]
-    # For now, let to_ngff_zarr handle writing multiple images by using the
-    # first approach with a simple call
 
-    # Actually, the simplest approach is to just write all NgffImages at once
-    # by creating the multiscales structure that to_ngff_zarr expects
-    from ngff_zarr import to_multiscales  # type: ignore[import-untyped]
+def _dataset_to_ngff_image(
+    dataset: xr.Dataset, chunks: int | tuple[int, ...] | None = None
+) -> NgffImage:
+    """Convert the first data variable of a Dataset to an NgffImage.
 
-    # We create a multiscales from the first image with no downsampling,
-    # then we'll overwrite with all our images. But we need to manually update
-    # the metadata datasets list to match.
-    base_multiscales = to_multiscales(ngff_images[0], scale_factors=[])
+    Lazy (dask) data is kept lazy so ngff-zarr writes it chunk by chunk
+    instead of from an in-memory copy. If ``chunks`` is given, the image data
+    is chunked to it, which sets the chunk shape of the written zarr array.
+    """
+    # Get the first data variable (assumes single image array)
+    data_var_name = next(iter(dataset.data_vars))
+    data_array = dataset[data_var_name]
 
-    # Update the images list
-    base_multiscales.images = ngff_images
+    # Convert coordinates back to OME-NGFF transformations, with the string
+    # keys and float values ngff-zarr expects
+    scale, translation = coords_to_transforms(dataset)
 
-    # Update the metadata to include dataset entries for each resolution level
-    # The metadata should have a datasets list with one entry per resolution
-    for i in range(1, len(ngff_images)):
-        # Copy the first dataset entry and update the path
-        from copy import deepcopy
+    ngff_image = to_ngff_image(
+        data_array.data,
+        dims=[str(d) for d in data_array.dims],
+        scale={str(k): float(v) for k, v in scale.items()},
+        translation={str(k): float(v) for k, v in translation.items()},
+        name=data_var_name,
+        axes_units=dataset.attrs.get("ome_axes_units"),
+    )
+    if chunks is not None:
+        # to_ngff_image always wraps the data in a dask array
+        ngff_image.data = ngff_image.data.rechunk(chunks)
+    return ngff_image
 
-        new_dataset = deepcopy(base_multiscales.metadata.datasets[0])
-        new_dataset.path = str(i)
-        base_multiscales.metadata.datasets.append(new_dataset)
 
-    # Write to disk
-    to_ngff_zarr(str(path), base_multiscales)
+def _replace_transforms(
+    transforms: list[Any], scale: list[float], translation: list[float]
+) -> list[Any]:
+    """Return ``transforms`` with the scale and translation values replaced.
+
+    Handles both the flat transform lists of NGFF v0.4/v0.5 and the transform
+    sequences of later versions.
+    """
+    replaced = []
+    for transform in transforms:
+        if transform.type == "sequence":
+            transform = replace(
+                transform,
+                transformations=_replace_transforms(transform.transformations, scale, translation),
+            )
+        elif transform.type == "scale":
+            transform = replace(transform, scale=scale)
+        elif transform.type == "translation":
+            transform = replace(transform, translation=translation)
+        replaced.append(transform)
+    return replaced